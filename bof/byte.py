@@ -9,14 +9,31 @@
           as first parameter.
 """
 
-from re import match
+from itertools import chain
+import re
 
 from .base import BOFProgrammingError
 from ipaddress import IPv4Address
 
 __DEFAULT_BYTEORDER = 'big'
+_BYTEORDERS = ("big", "little")
 _BYTEORDER = __DEFAULT_BYTEORDER
 
+# Bits of every possible byte value, most (BE) or least (LE) significant first
+_BYTE_TO_BITS_BE = [tuple((b >> i) & 1 for i in range(7, -1, -1)) for b in range(256)]
+_BYTE_TO_BITS_LE = [bits[::-1] for bits in _BYTE_TO_BITS_BE]
+# Below these numbers of bits (the usual case for fields), plain Python loops
+# convert between ints and bit lists faster than formatting or packing them
+_MIN_FORMATTED_BITS = 16
+_MIN_PACKED_BITS = 64
+# Maps ASCII binary digits to their value
+_BINARY_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+# Separators removed from MAC address strings
+_MAC_SEPARATORS = {ord(':'): None, ord('-'): None}
+# KNX individual (X.Y.Z) and group (X/Y/Z) addresses
+_KNX_INDIV = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{1,3})")
+_KNX_GROUP = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{1,3})")
+
 def set_byteorder(byteorder:str) -> None:
     """Changes default byte order to use is byte conversion functions.
     
@@ -28,11 +45,23 @@ def set_byteorder(byteorder:str) -> None:
 
         set_byteorder(byteorder:str) -> None
     """
-    if byteorder not in ["big", "little"]:
+    if byteorder not in _BYTEORDERS:
         raise BOFProgrammingError("Byte order is either 'big' or 'little'")
     global _BYTEORDER
     _BYTEORDER = byteorder
 
+def _get_byteorder(byteorder:str=None) -> str:
+    """Returns ``byteorder`` if set, else the global byteorder, which has
+    already been checked by ``set_byteorder()``.
+
+    :raises BOFProgrammingError: If ``byteorder`` is set and invalid.
+    """
+    if not byteorder:
+        return _BYTEORDER
+    if byteorder not in _BYTEORDERS:
+        raise BOFProgrammingError("Byte order is either 'big' or 'little'")
+    return byteorder
+
 
 def get_size(array) -> int:
     """Gives the number of bytes the parameter ``array`` fits into.
@@ -72,17 +101,13 @@ def resize(array:bytes, size:int, byteorder:str=None) -> bytes:
         >>> x
         b'\x00\x00\x00\xd2'
     """
-    global _BYTEORDER
-    byteorder = byteorder if byteorder else _BYTEORDER
+    byteorder = _get_byteorder(byteorder)
+    if size == len(array):
+        return array
     if size < len(array):
         return array[len(array)-size:] if byteorder == 'big' else array[:size]
-    if size > len(array):
-        padding = []
-        for _ in range(size - len(array)):
-            padding += [b'\x00']
-        padding = b''.join(padding)
-        return padding + array if byteorder == 'big' else array + padding
-    return array
+    padding = bytes(size - len(array))
+    return padding + array if byteorder == 'big' else array + padding
 
 def from_int(value:int, size:int=0, byteorder:str=None) -> bytes:
     """Converts an integer to a bytearray.
@@ -103,16 +128,19 @@ def from_int(value:int, size:int=0, byteorder:str=None) -> bytes:
         >>> bof.byte.from_int(65980, size=8, byteorder='big')
         b'\x00\x00\x00\x00\x00\x01\x01\xbc'
     """
-    global _BYTEORDER
-    byteorder = byteorder if byteorder else _BYTEORDER
-    if byteorder not in ["big", "little"]:
-        raise BOFProgrammingError("Byte order is either 'big' or 'little'")
+    byteorder = _get_byteorder(byteorder)
     if not isinstance(value, int) or not isinstance(size, int):
         raise BOFProgrammingError("Int to bytes expects an int")
-    value = value.to_bytes((value.bit_length() + 7) // 8, byteorder)
-    if len(value) == 0:
-        size = 1 if not size else size
-    return resize(value, len(value) if not size else size, byteorder)
+    if size > 0:
+        try:
+            return value.to_bytes(size, byteorder)
+        except OverflowError:
+            if value < 0:
+                raise
+            # Truncated as resize() does: least significant bytes are kept
+            return (value & ((1 << 8*size) - 1)).to_bytes(size, byteorder)
+    # Smallest array the value fits into, zero still needs one byte
+    return value.to_bytes((value.bit_length() + 7) // 8 or 1, byteorder)
 
 def to_int(array:bytes, byteorder:str=None) -> int:
     """Converts a byte array to an integer.
@@ -129,10 +157,7 @@ def to_int(array:bytes, byteorder:str=None) -> int:
         >>> bof.byte.to_int(b'\x01\x01\xbc')
         65980
     """
-    global _BYTEORDER
-    byteorder = byteorder if byteorder else _BYTEORDER
-    if byteorder not in ["big", "little"]:
-        raise BOFProgrammingError("Byte order is either 'big' or 'little'")
+    byteorder = _get_byteorder(byteorder)
     if not isinstance(array, bytes):
         raise BOFProgrammingError("Bytes to int expects bytes")
     return int.from_bytes(array, byteorder)
@@ -150,15 +175,19 @@ def from_ipv4(ip:str, size:int=0, byteorder:str=None) -> bytes:
 
         value = byte.from_ipv4("127.0.0.1")
     """
-    return bytes(map(int, ip.split('.')))
+    a, b, c, d = ip.split('.', 3)
+    return bytes((int(a), int(b), int(c), int(d)))
 
 def to_ipv4(array:bytes) -> str:
     """Converts a byte array representing an IPv4 address to a string with
-    format "A.B.C.D" (IPv4) using Python's builtin ``ipaddress`` module.
+    format "A.B.C.D" (IPv4). Arrays that are not 4 bytes long are handed to
+    Python's builtin ``ipaddress`` module.
 
     :param array: Byte array to convert to an IPv4 address (usually 4 bytes :)).
     :returns: The IP address as a string with format ``"A.B.C.D"``
     """
+    if len(array) == 4:
+        return "%d.%d.%d.%d" % tuple(array)
     return str(IPv4Address(array))
 
 def to_mac(array:bytes) -> str:
@@ -168,17 +197,16 @@ def to_mac(array:bytes) -> str:
     :param array: Byte array to convert to a MAC address (usually 6 bytes)
     :returns: The MAC address as a string.
     """
-    return ':'.join(("%02x" % b) for b in array)
+    return array.hex(':')
 
 def from_mac(mac:str):
     """Converts a MAC address as a string with format AA:BB:CC:DD:EE:FF
-    to a byte array (6 bytes).
+    (or AA-BB-CC-DD-EE-FF) to a byte array (6 bytes).
 
     :param mac: String with MAC address
     :returns: A byte array of the corresponding MAC address.
     """
-    array = bytes.fromhex(mac.replace(":", ""))
-    return array
+    return bytes.fromhex(mac.translate(_MAC_SEPARATORS))
 
 def to_knx(value:bytes, group=False) -> str:
     """Converts a 2-bytes array to a KNX individual (X.Y.Z) or group 
@@ -186,7 +214,7 @@ def to_knx(value:bytes, group=False) -> str:
 
     :Individual address ``X.Y.Z``: X and Y are 4 bits (1st byte) and
                                    Z is 8 bits (2nd byte).
-    :Group address ``X/Y/Z``: X is 6 bits, Y is 3 bits (1st byte) and
+    :Group address ``X/Y/Z``: X is 5 bits, Y is 3 bits (1st byte) and
                               Z is 8 bits (2nd byte).
 
     :param value: Byte array (2 bytes) to convert
@@ -196,11 +224,10 @@ def to_knx(value:bytes, group=False) -> str:
     """
     if not len(value):
         return None
-    first_chunk_size = 5 if group else 4
+    y_size = 3 if group else 4
     string_format = "{0}/{1}/{2}" if group else "{0}.{1}.{2}"
-    bitlist = to_bit_list(value[:1])
-    x = int("".join([str(x) for x in bitlist[:first_chunk_size]]), 2)
-    y = int("".join([str(x) for x in bitlist[first_chunk_size:]]), 2)
+    x = value[0] >> y_size
+    y = value[0] & ((1 << y_size) - 1)
     z = to_int(value[1:])
     return string_format.format(x, y, z)
 
@@ -212,19 +239,16 @@ def from_knx(address:str) -> bytes:
     :param address: KNX address as a string with format X.Y.Z or
                     X/Y/Z.
     """
-    addr = match("(\d{1,2})\.(\d{1,2})\.(\d{1,3})", address)
-    first_chunk_size = 4 # individual address
+    addr = _KNX_INDIV.match(address)
+    y_size = 4 # individual address
     if not addr:
-        addr = match("(\d{1,2})/(\d{1,2})/(\d{1,3})", address)
-        first_chunk_size = 5 # group address
+        addr = _KNX_GROUP.match(address)
+        y_size = 3 # group address
     if not addr:
         return None
-    x, y, z = (int(addr.group(a+1)) for a in range(3))
-    x = int_to_bit_list(x)[8-first_chunk_size:]
-    y = int_to_bit_list(y)[first_chunk_size:]
-    b1 = from_int(bit_list_to_int(x + y))
-    b2 = from_int(z)
-    return b''.join([b1, b2])
+    x, y, z = map(int, addr.groups())
+    b1 = ((x << y_size) | (y & ((1 << y_size) - 1))) & 0xFF
+    return bytes((b1,)) + from_int(z)
 
 def int_to_bit_list(n:int, size:int=8, byteorder:str=None) -> list:
     """Representation of n as a list of bits (0 or 1).
@@ -237,16 +261,18 @@ def int_to_bit_list(n:int, size:int=8, byteorder:str=None) -> list:
     :returns: The value of the integer ``n`` as a list of bits (0 or 1).
     :raises BOFProgrammingError: If ``byteorder`` is invalid.
     """
-    global _BYTEORDER
-    byteorder = byteorder if byteorder else _BYTEORDER
-    if byteorder not in ["big", "little"]:
-        raise BOFProgrammingError("Byte order is either 'big' or 'little'")
-    t = []
-    for i in range(size):
-        b = n & 1
-        t.append(b)
-        n >>= 1
-    if byteorder == 'big':
+    byteorder = _get_byteorder(byteorder)
+    if size < _MIN_FORMATTED_BITS:
+        t = []
+        for _ in range(size):
+            t.append(n & 1)
+            n >>= 1
+        if byteorder == 'big':
+            t.reverse()
+        return t
+    # Binary string of the last size bits, turned into 0 and 1 byte values
+    t = list(format(n & ((1 << size) - 1), '0%db' % size).encode().translate(_BINARY_DIGITS))
+    if byteorder != 'big':
         t.reverse()
     return t
 
@@ -260,36 +286,39 @@ def bit_list_to_int(t:list, byteorder:str=None) -> int:
     :raises BOFProgrammingError: If ``byteorder`` is invalid.
 
     """
-    global _BYTEORDER
-    byteorder = byteorder if byteorder else _BYTEORDER
-    if byteorder not in ["big", "little"]:
-        raise BOFProgrammingError("Byte order is either 'big' or 'little'")
-    n = 0
+    byteorder = _get_byteorder(byteorder)
     if byteorder != 'big':
-        t = reversed(t)
-    for b in t:
-        n <<= 1
-        n += b
-    return n
+        t = t[::-1]
+    if len(t) < _MIN_PACKED_BITS or len(t) % 8:
+        n = 0
+        for b in t:
+            n <<= 1
+            n += b
+        return n
+    # Long lists of whole bytes: pack bits 8 by 8, int.from_bytes does the rest
+    array = bytes((t[i] << 7) | (t[i+1] << 6) | (t[i+2] << 5) | (t[i+3] << 4) |
+                  (t[i+4] << 3) | (t[i+5] << 2) | (t[i+6] << 1) | t[i+7]
+                  for i in range(0, len(t), 8))
+    return int.from_bytes(array, 'big')
 
 def to_bit_list(value:bytes, size=None, byteorder:str=None) -> list:
     """List of bits represented by the bytes-like object value.
 
     :param value: Bytes to convert to a list of bits.
-    :param size: If set, the list will be of the specified size.
+    :param size: If set, the list is truncated or padded with zeros (at the
+                 end) to the specified size.
     :param byteorder: If not set, global ``byteorder`` will be used (set with
                       ``set_byteorder()``).
     :returns: The bytes ``value`` represented as a list of bits.
     :raises BOFProgrammingError: If ``byteorder`` is invalid.
 
     """
-    global _BYTEORDER
-    byteorder = byteorder if byteorder else _BYTEORDER
-    if byteorder not in ["big", "little"]:
-        raise BOFProgrammingError("Byte order is either 'big' or 'little'")
-    n = int.from_bytes(value, byteorder=byteorder)
-    size = size if size else 8 * len(value)
-    return int_to_bit_list(n, size=8*len(value))
+    byteorder = _get_byteorder(byteorder)
+    table = _BYTE_TO_BITS_BE if byteorder == 'big' else _BYTE_TO_BITS_LE
+    t = list(chain.from_iterable(table[b] for b in value))
+    if size is not None and size != len(t):
+        t = t[:size] + [0] * (size - len(t))
+    return t
 
 def from_bit_list(bits:list, byteorder:str=None) -> bytes:
     """Array of bytes representing the list of bits t.
@@ -300,10 +329,7 @@ def from_bit_list(bits:list, byteorder:str=None) -> bytes:
     :returns: The list of bits represented as a bytes-like object.
     :raises BOFProgrammingError: If ``byteorder`` is invalid.
     """
-    global _BYTEORDER
-    byteorder = byteorder if byteorder else _BYTEORDER
-    if byteorder not in ["big", "little"]:
-        raise BOFProgrammingError("Byte order is either 'big' or 'little'")
+    byteorder = _get_byteorder(byteorder)
     assert len(bits) % 8 == 0
     n = bit_list_to_int(bits, byteorder=byteorder)
     return n.to_bytes(len(bits) // 8, byteorder=byteorder)
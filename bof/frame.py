@@ -71,6 +71,7 @@ class BOFBitField(object):
         >>> response.body.cemi.field1_field2.value
         b'\\x10\\x01' # Stands for 0001 0000 0000 0001
     """
+    __slots__ = ("name", "size", "__value")
     name:str
     size:int
     __value:list # Bit list
@@ -124,6 +125,9 @@ class BOFField(object):
     :param bitsizes: List storing the sizes (in bit) of bit fields within the
                      field.
     """
+    # Fields are numerous and never get dynamic attributes (unlike blocks)
+    __slots__ = ("_name", "_size", "_value", "_parent", "_is_length",
+                 "_fixed_size", "_fixed_value", "_bitfields", "_bitsizes")
     _name:str
     _size:int
     _value:bytes
@@ -135,23 +139,23 @@ class BOFField(object):
     _bitsizes:list
 
     def __init__(self, **kwargs):
-        self.name = kwargs[spec.NAME] if spec.NAME in kwargs else ""
-        self._value = kwargs[spec.VALUE] if spec.VALUE in kwargs else b''
+        self.name = kwargs.get(spec.NAME, "")
+        self._value = kwargs.get(spec.VALUE, b'')
         if spec.SIZE in kwargs:
             self._size = byte.to_int(kwargs[spec.SIZE]) if isinstance(kwargs[spec.SIZE], bytes) \
                          else int(kwargs[spec.SIZE])
         else: 
             self._size = max(1, byte.get_size(self._value))
-        self._parent = kwargs[PARENT] if PARENT in kwargs else None
-        self._is_length = kwargs[spec.IS_LENGTH] if spec.IS_LENGTH in kwargs else False
-        self._fixed_size = kwargs[spec.F_SIZE] if spec.F_SIZE in kwargs else False
-        self._fixed_value = kwargs[spec.F_VALUE] if spec.F_VALUE in kwargs else False
+        self._parent = kwargs.get(PARENT)
+        self._is_length = kwargs.get(spec.IS_LENGTH, False)
+        self._fixed_size = kwargs.get(spec.F_SIZE, False)
+        self._fixed_value = kwargs.get(spec.F_VALUE, False)
         self._set_bitfields(**kwargs)
         # From now on, _update_value must be used to modify values within the code
-        if spec.OPTIONAL in kwargs and kwargs[spec.OPTIONAL] and self._value == b'':
+        if kwargs.get(spec.OPTIONAL) and self._value == b'':
             self._size = 0 # We create the field byt don't use it.
             return
-        if spec.VALUE in kwargs and kwargs[spec.VALUE] != b'':
+        if kwargs.get(spec.VALUE, b'') != b'':
             self._update_value(kwargs[spec.VALUE])
         elif spec.DEFAULT in kwargs:
             self._update_value(kwargs[spec.DEFAULT])
@@ -349,8 +353,8 @@ class BOFBlock(object):
             "and requires previous initialization of a BOFSpec object in the " \
             "subclass' constructor.")
         # Basic block information
-        self.name = kwargs[spec.NAME] if spec.NAME in kwargs else ""
-        self._parent = kwargs[PARENT] if PARENT in kwargs else None
+        self.name = kwargs.get(spec.NAME, "")
+        self._parent = kwargs.get(PARENT)
         self._content = []
         # Create and fill the block
         self.build(**kwargs)
@@ -402,10 +406,10 @@ class BOFBlock(object):
                                      JSON spec file's blocks list or if the
                                      format found is invalid.
         """
-        if not spec.TYPE in kwargs or kwargs[spec.TYPE] == spec.BLOCK:
+        if kwargs.get(spec.TYPE, spec.BLOCK) == spec.BLOCK:
             return
         # If values rely on previous content, replace them
-        user_values = kwargs[USER_VALUES] if USER_VALUES in kwargs else {}
+        user_values = kwargs.get(USER_VALUES, {})
         self._get_depends(kwargs, user_values)
         # Retrieve the template in the JSON file and check it
         block_template = self._spec.get_block_template(kwargs[spec.TYPE])
@@ -413,19 +417,22 @@ class BOFBlock(object):
             raise BOFProgrammingError("Unknown block type ({0})".format(kwargs[spec.TYPE]))
         if not isinstance(block_template, list):
             raise BOFProgrammingError("Invalid block format ({0})".format(kwargs[spec.TYPE]))
-        # Create block and fill them (if value) one by one
-        value = kwargs[VALUE] if VALUE in kwargs else None
+        # Create block and fill them (if value) one by one. Value is read
+        # through a memoryview so that the remaining part is never copied.
+        value = kwargs.get(VALUE)
+        value = memoryview(value) if value else value
+        offset = 0
         for item_template in block_template:
             # First we need to replace the "depends" part (dictionary must be copied)
             final_template = self._get_depends(item_template.copy(), user_values)
-            item = self.factory(final_template, value=value,
+            item = self.factory(final_template, value=value[offset:] if value else value,
                                 user_values=user_values, parent=self)
             self.append(item)
-            # If value, we extract part of it to fill the item
+            # If value, the next item is filled with what comes after this one
             if value:
-                if len(item) >= len(value):
+                offset += len(item)
+                if offset >= len(value):
                     break
-                value = value[len(item):]
 
     def append(self, content) -> None:
         """Appends a block, a field or a list of blocks and/fields to
@@ -655,16 +662,19 @@ class BOFFrame(object):
         for arg, code in self._user_args.items():
             if arg in kwargs:
                 user_values[code] = self._spec.get_code_key(code, kwargs[arg])
-        value = kwargs[BYTES] if BYTES in kwargs else None
+        value = kwargs.get(BYTES)
+        value = memoryview(value) if value else value
+        offset = 0
         # Now build the frame according to what the spec says.
         for block_template in self._spec.frame:
-            block = block_class(value=value, user_values=user_values,
-                                parent=self, **block_template)
+            block = block_class(value=value[offset:] if value else value,
+                                user_values=user_values, parent=self,
+                                **block_template)
             self.append(block_template[spec.NAME], block)
             if value:
-                if len(self._blocks[block_template[spec.NAME]]) >= len(value):
+                offset += len(self._blocks[block_template[spec.NAME]])
+                if offset >= len(value):
                     break
-                value = value[len(self._blocks[block_template[spec.NAME]]):]
 
     def __bytes__(self):
         self.update()
@@ -38,6 +38,7 @@ from .. import byte, spec
 ###############################################################################
 
 KNXSPECFILE = "knxnet.json"
+_KNXSPECFILE_PATH = path.join(path.dirname(path.realpath(__file__)), KNXSPECFILE)
 
 TOTAL_LENGTH = "total_length"
 
@@ -57,29 +58,51 @@ class KnxSpec(spec.BOFSpec):
 
     def __init__(self, filepath:str=None):
         if not filepath:
-            filepath = path.join(path.dirname(path.realpath(__file__)), KNXSPECFILE)
+            filepath = _KNXSPECFILE_PATH
         super().__init__(filepath)
 
     def get_code_value(self, code:str, identifier) -> str:
-        code = self._get_dict_key(self.codes, code)
-        if isinstance(identifier, bytes) and code in self.codes:
-            for key in self.codes[code]:
-                if identifier == bytes.fromhex(key):
-                    return self.codes[code][key]
+        index = self._get_code_index(code)
+        if not index:
+            return None
+        names_by_id, names, _ = index
+        if isinstance(identifier, bytes):
+            return names_by_id.get(identifier)
         if isinstance(identifier, str):
-            identifier = to_property(identifier)
-            for service in self.codes[code].values():
-                if identifier == to_property(service):
-                    return service
+            return names.get(to_property(identifier))
         return None
 
     def get_code_key(self, dict_key:dict, name:str) -> bytes:
-        name = to_property(name)
-        dict_key = self._get_dict_key(self.codes, dict_key)
-        for key, value in self.codes[dict_key].items():
-            if name == to_property(value):
-                return bytes.fromhex(key)
-        return None
+        index = self._get_code_index(dict_key)
+        if not index or not isinstance(name, str):
+            return None
+        _, _, ids_by_name = index
+        return ids_by_name.get(to_property(name))
+
+    def _get_code_index(self, code:str) -> tuple:
+        """Indexes a code table from the specification file the first time
+        it is used, so that codes are not scanned on each lookup.
+
+        :param code: Name of the code table, case and separator insensitive.
+        :returns: A tuple of dictionaries (names by identifier, names by
+                  property name, identifiers by property name), or None if
+                  the code table does not exist.
+        """
+        indexes = self._get_lookups("code indexes")
+        if code not in indexes:
+            key = self._get_dict_key(self.codes, code)
+            if key is None:
+                indexes[code] = None
+            else:
+                names_by_id, names, ids_by_name = {}, {}, {}
+                # setdefault: the first entry wins, as with a linear scan
+                for identifier, name in self.codes[key].items():
+                    identifier = bytes.fromhex(identifier)
+                    names_by_id.setdefault(identifier, name)
+                    names.setdefault(to_property(name), name)
+                    ids_by_name.setdefault(to_property(name), identifier)
+                indexes[code] = (names_by_id, names, ids_by_name)
+        return indexes[code]
 
 ###############################################################################
 # KNX FRAME CONTENT                                                           #
@@ -99,6 +122,7 @@ class KnxField(BOFField):
 
     **KNX Standard v2.1 03_08_02**
     """
+    __slots__ = ()
 
     #-------------------------------------------------------------------------#
     # Properties                                                              #
@@ -154,18 +178,20 @@ class KnxBlock(BOFBlock):
 
         :param user_values: Default values to assign a field as a dictionary
                             with format {"field name": b"value"}
-        :param value: Content of block or field to set.
+        :param value: Content of block or field to set (bytes or memoryview).
         """
-        if spec.TYPE in template and template[spec.TYPE] == spec.FIELD:
-            value = b''
-            if USER_VALUES in kwargs and template[spec.NAME] in kwargs[USER_VALUES]:
-                value = kwargs[USER_VALUES][template[spec.NAME]]
-            elif VALUE in kwargs and kwargs[VALUE]:
-                if isinstance(template[spec.SIZE], bytes):
-                    template[spec.SIZE] = byte.to_int(template[spec.SIZE])
-                value = kwargs[VALUE][:template[spec.SIZE]]
-            return KnxField(**template, value=value)
-        return cls(**template, **kwargs)
+        if template.get(spec.TYPE) != spec.FIELD:
+            return cls(**template, **kwargs)
+        user_values = kwargs.get(USER_VALUES)
+        value = kwargs.get(VALUE)
+        if user_values and template[spec.NAME] in user_values:
+            return KnxField(**template, value=user_values[template[spec.NAME]])
+        if not value:
+            return KnxField(**template, value=b'')
+        size = template[spec.SIZE]
+        if isinstance(size, bytes):
+            size = template[spec.SIZE] = byte.to_int(size)
+        return KnxField(**template, value=bytes(value[:size]))
 
     def __init__(self, **kwargs):
         """Initialize the ``KnxBlock`` with a mandatory name and optional
@@ -124,6 +124,7 @@ class BOFSpec(object):
         content = load_json(filepath)
         for key in content.keys():
             setattr(self, to_property(key), content[key])
+        self._lookups = {}
 
     def clear(self):
         """Remove all content loaded in class previously, and associated
@@ -154,11 +155,13 @@ class BOFSpec(object):
         :param item_name: Name of the item to look for in the block.
         :returns: Item template associated to block_name and item_name
         """
-        if block_name in self.blocks:
-            for item in self.blocks[block_name]:
-                if item[NAME] == item_name:
-                    return item
-        return None
+        items = self._get_lookups("item templates")
+        if block_name not in items:
+            items[block_name] = {}
+            # setdefault: the first item wins, as with a linear scan
+            for item in self.blocks.get(block_name, []):
+                items[block_name].setdefault(item[NAME], item)
+        return items[block_name].get(item_name)
 
     def get_block_template(self, block_name:str) -> list:
         """Returns a block template (list of item templates) from a block name.
@@ -166,12 +169,24 @@ class BOFSpec(object):
         :param block_name: Name of the block we want the template from.
         :returns: Block template associated with the specifified block_name.
         """
-        return self._get_dict_value(self.blocks, block_name) if block_name else None
+        if not block_name:
+            return None
+        templates = self._get_lookups("block templates")
+        if block_name not in templates:
+            templates[block_name] = self._get_dict_value(self.blocks, block_name)
+        return templates[block_name]
 
     #-------------------------------------------------------------------------#
     # Internals                                                               #
     #-------------------------------------------------------------------------#
 
+    def _get_lookups(self, category:str) -> dict:
+        """Returns the dictionary memoizing lookups of a given category.
+        Specification content does not change between two calls to ``load()``
+        or ``clear()``, which both drop previous lookups.
+        """
+        return self.__dict__.setdefault("_lookups", {}).setdefault(category, {})
+
     def _get_dict_key(self, dictionary:dict, dict_key:str) -> str:
         """As a key can be given with wrong formatting (underscores,
         capital, lower, upper cases, we match the value given with
@@ -65,6 +65,16 @@ class Test02ByteIntConversion(unittest.TestCase):
         """Test bytes to int conversion with invalid byteorder."""
         with self.assertRaises(bof.BOFProgrammingError):
             bof.byte.to_int(2, 'frite')
+    def test_09_int_truncated_conversion(self):
+        """Test forced smaller size int to byte conversion."""
+        x = bof.byte.from_int(65980, size=2, byteorder='big')
+        self.assertEqual(x, b'\x01\xbc')
+        x = bof.byte.from_int(65980, size=2, byteorder='little')
+        self.assertEqual(x, b'\xbc\x01')
+    def test_10_negative_int_conversion(self):
+        """Test that negative ints cannot be converted to bytes."""
+        with self.assertRaises(OverflowError):
+            bof.byte.from_int(-1, size=2)
 
 class Test03ByteResize(unittest.TestCase):
     """Test class for byte array resizing functions."""
@@ -88,6 +98,10 @@ class Test03ByteResize(unittest.TestCase):
         x = bof.byte.resize(x, 4)
         self.assertEqual(x, b'\x00\x00\x00\xd2')
         self.assertEqual(bof.byte.to_int(x), 210)
+    def test_04_byte_resize_invalidbyteorder(self):
+        """Test resize with invalid byteorder."""
+        with self.assertRaises(bof.BOFProgrammingError):
+            bof.byte.resize(b'\x04\xd2', 4, 'frite')
 
 class Test04ByteAndBits(unittest.TestCase):
     """Test class for bit manipulation inside bits."""
@@ -103,6 +117,16 @@ class Test04ByteAndBits(unittest.TestCase):
         value=15
         field[:size] = bof.byte.int_to_bit_list(value)[-size:]
         self.assertEqual(bof.byte.from_bit_list(field), b"\xF0\x00")
+    def test_03_bit_list_size(self):
+        """Test that bit lists are truncated or padded to the requested size."""
+        self.assertEqual(bof.byte.to_bit_list(b"\xF0\x0F", size=4), [1, 1, 1, 1])
+        self.assertEqual(bof.byte.to_bit_list(b"\x80", size=10), [1] + [0] * 9)
+    def test_04_bit_list_little_endian(self):
+        """Test conversion to bit list and back with explicit little endian."""
+        self.assertEqual(bof.byte.to_bit_list(b"\x01", byteorder='little'), [1] + [0] * 7)
+        field = b"\x10\x02"
+        bits = bof.byte.to_bit_list(field, byteorder='little')
+        self.assertEqual(bof.byte.from_bit_list(bits, byteorder='little'), field)
 
 
 
@@ -148,6 +172,42 @@ class Test05BitListIntConversion(unittest.TestCase):
         value = 19
         with self.assertRaises(bof.BOFProgrammingError):
             bof.bit_list_to_int(bof.int_to_bit_list(2), byteorder='frite')
+    def test_07_int_to_bits_and_back_large_sizes(self):
+        """Test conversion from int to bit list and back with 16 bits or more."""
+        value = 0x1234
+        for size in (16, 32, 64, 100):
+            for byteorder in ('big', 'little'):
+                list_result = bof.int_to_bit_list(value, size, byteorder=byteorder)
+                self.assertEqual(len(list_result), size)
+                result = bof.bit_list_to_int(list_result, byteorder=byteorder)
+                self.assertEqual(value, result)
+        self.assertEqual(bof.int_to_bit_list(0x1234, 16), [0,0,0,1,0,0,1,0,0,0,1,1,0,1,0,0])
+        self.assertEqual(bof.int_to_bit_list(0x1234, 16, byteorder='little'),
+                         [0,0,1,0,1,1,0,0,0,1,0,0,1,0,0,0])
+    def test_08_int_to_bits_large_sizes_masked(self):
+        """Test that only the last bits of negative or oversized ints are kept."""
+        self.assertEqual(bof.int_to_bit_list(-1, 32), [1] * 32)
+        self.assertEqual(bof.int_to_bit_list(-1, 32, byteorder='little'), [1] * 32)
+        result = bof.bit_list_to_int(bof.int_to_bit_list(0x1ffff, 16))
+        self.assertEqual(0xffff, result)
+        result = bof.bit_list_to_int(bof.int_to_bit_list(1 << 70 | 5, 64, byteorder='little'),
+                                     byteorder='little')
+        self.assertEqual(5, result)
+    def test_09_long_bit_lists_and_back(self):
+        """Test conversion from bytes to long bit lists (64 bits or more) and back."""
+        for size in (8, 9, 16):
+            field = bytes(range(1, size + 1))
+            for byteorder in ('big', 'little'):
+                bits = bof.byte.to_bit_list(field, byteorder=byteorder)
+                self.assertEqual(bof.byte.from_bit_list(bits, byteorder=byteorder), field)
+                self.assertEqual(bof.bit_list_to_int(bits, byteorder=byteorder),
+                                 int.from_bytes(field, byteorder))
+    def test_10_long_bit_list_not_whole_bytes(self):
+        """Test conversion from a bit list of 64 bits or more that is not
+        made of whole bytes."""
+        bits = [1] + [0] * 63 + [1]
+        self.assertEqual(bof.bit_list_to_int(bits), (1 << 64) | 1)
+        self.assertEqual(bof.bit_list_to_int([1] + [0] * 64, byteorder='little'), 1)
 
 
 class Test06BytesIpv4Conversion(unittest.TestCase):
@@ -159,6 +219,15 @@ class Test06BytesIpv4Conversion(unittest.TestCase):
         """Test conversion from ipv4 to bYtes, and from bytes to ipv4."""
         ip = "127.0.0.1"
         self.assertEqual(bof.to_ipv4(bof.from_ipv4(ip)), "127.0.0.1")
+    def test_02_invalid_ipv4_to_bytes(self):
+        """Test that conversion of an IPv4 without 4 parts raises an error."""
+        with self.assertRaises(ValueError):
+            bof.from_ipv4("1.2.3")
+        with self.assertRaises(ValueError):
+            bof.from_ipv4("1.2.3.4.5")
+    def test_03_bytearray_to_ipv4(self):
+        """Test conversion from a bytearray to ipv4."""
+        self.assertEqual(bof.to_ipv4(bytearray(b"\x7f\x00\x00\x01")), "127.0.0.1")
     
 class Test07BytesMacConversion(unittest.TestCase):
     """Test class for bytes conversion to mac address."""
@@ -189,9 +258,13 @@ class Test07BytesMacConversion(unittest.TestCase):
         """Test conversion bytes to mac address with less than 6 bytes."""
         result = bof.to_mac(b'\xAB\x5C')
         self.assertEqual("AB:5C".upper(),result.upper())
+    def test_06_mac_with_dashes_to_bytes(self):
+        """Test conversion mac address with dash separators to bytes."""
+        result = bof.from_mac("AB-5C-DF-AA-A2-FC")
+        self.assertEqual(b'\xAB\x5C\xDF\xAA\xA2\xFC', result)
 
-class Test07BytesMacConversion(unittest.TestCase):
-    """Test class for bytes conversion to mac address."""
+class Test08BytesKnxConversion(unittest.TestCase):
+    """Test class for bytes conversion to KNX addresses."""
     @classmethod
     def setUpClass(self):
         bof.set_byteorder('big')
@@ -207,6 +280,15 @@ class Test07BytesMacConversion(unittest.TestCase):
     def test_02_bytes_to_knx_group(self):
         """Test that we can convert bytes to X/Y/Z"""
         self.assertEqual(bof.byte.to_knx(b"\x09\xff", group=True), "1/1/255")
+    def test_05_knx_little_endian(self):
+        """Test that KNX address conversion does not depend on byteorder."""
+        bof.set_byteorder('little')
+        try:
+            self.assertEqual(bof.byte.from_knx("1.1.1"), b"\x11\x01")
+            self.assertEqual(bof.byte.to_knx(b"\x11\x01"), "1.1.1")
+            self.assertEqual(bof.byte.to_knx(bof.byte.from_knx("1/1/255"), group=True), "1/1/255")
+        finally:
+            bof.set_byteorder('big')
 
 if __name__ == '__main__':
     unittest.main()
@@ -81,6 +81,24 @@ class Test01KnxSpecTesting(unittest.TestCase):
         """Test that we can retrieve the name of a cEMI from its message code."""
         cemi = knx.KnxSpec().get_code_value("message_code", b"\xfc")
         self.assertEqual(cemi, "PropRead.req")
+    def test_05_unknown_code_table(self):
+        """Test that lookups in a code table that does not exist return None."""
+        self.assertEqual(knx.KnxSpec().get_code_value("pom", b"\x02\x03"), None)
+        self.assertEqual(knx.KnxSpec().get_code_value("pom", "description request"), None)
+        self.assertEqual(knx.KnxSpec().get_code_key("pom", "description request"), None)
+    def test_06_get_item_template(self):
+        """Test that we can retrieve an item template from a block and its name."""
+        spec = knx.KnxSpec()
+        template = spec.get_item_template("HPAI", "ip address")
+        self.assertEqual(template["size"], 4)
+        self.assertEqual(spec.get_item_template("HPAI", "pom"), None)
+        self.assertEqual(spec.get_item_template("POM", "ip address"), None)
+        # Item templates are indexed again after the spec is reloaded
+        spec.clear()
+        with self.assertRaises(AttributeError):
+            spec.get_item_template("HPAI", "ip address")
+        spec.load(knx.knxframe._KNXSPECFILE_PATH)
+        self.assertEqual(spec.get_item_template("HPAI", "ip address"), template)
 
 class Test02AdvancedKnxHeaderCrafting(unittest.TestCase):
     """Test class for advanced header fields handling and altering."""
@@ -259,6 +277,44 @@ class Test05ReceivedFrameParsing(unittest.TestCase):
         discoreq.body.communication_channel_id.value = channel
         self.connection.send(discoreq)
 
+class Test05RawFrameParsing(unittest.TestCase):
+    """Test class for frames built from byte arrays, without network."""
+    # Same responses as in boiboite_simulator.py
+    DescrResp = b"\x06\x10\x02\x04\x00\x44\x36\x01\x02\x00\xff\xff\x00\x00\x00\x00" \
+                b"\x54\xff\xf4\x13\xe0\x00\x17\x0c\x00\x00\x54\xff\xf4\x13\x73\x70" \
+                b"\x61\x63\x65\x4c\x59\x6e\x6b\x00\x00\x00\x00\x00\x00\x00\x00\x00" \
+                b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x02\x02\x01" \
+                b"\x03\x01\x04\x01"
+    ConnectResp = b"\x06\x10\x02\x06\x00\x12\x01\x00\x08\x01\xc0\xa8\x00\x0a\x0e\x57" \
+                  b"\x02\x03"
+    def test_01_knx_parse_raw_descrresp(self):
+        """Test that a description response is parsed from bytes."""
+        frame = knx.KnxFrame(bytes=self.DescrResp)
+        self.assertEqual(frame.sid, "DESCRIPTION RESPONSE")
+        # Only one service family is parsed so far, we stop before them
+        self.assertEqual(bytes(frame)[:60], self.DescrResp[:60])
+        self.assertEqual(bytes(frame.body.device_hardware), self.DescrResp[6:60])
+        self.assertEqual(frame.body.device_hardware.friendly_name.value[:9], b"spaceLYnk")
+    def test_02_knx_parse_raw_connectresp(self):
+        """Test that a connect response is parsed from bytes."""
+        frame = knx.KnxFrame(bytes=self.ConnectResp)
+        self.assertEqual(frame.sid, "CONNECT RESPONSE")
+        self.assertEqual(bytes(frame), self.ConnectResp)
+        self.assertEqual(frame.body.data_endpoint.ip_address.value, b"\xc0\xa8\x00\x0a")
+    def test_03_knx_parse_raw_cemi_bitfields(self):
+        """Test that bit fields of a cEMI frame are parsed from bytes."""
+        request = knx.KnxFrame(type="CONFIGURATION REQUEST", cemi="PropRead.req")
+        request.body.cemi.cemi_data.propread_req.number_of_elements.value = 15
+        request.body.cemi.cemi_data.propread_req.start_index.value = 1
+        frame = knx.KnxFrame(bytes=bytes(request))
+        self.assertEqual(frame.sid, "CONFIGURATION REQUEST")
+        self.assertEqual(frame.cemi, "PropRead.req")
+        self.assertEqual(bytes(frame), bytes(request))
+        propread_req = frame.body.cemi.cemi_data.propread_req
+        self.assertEqual(propread_req.number_of_elements.value, [1,1,1,1])
+        self.assertEqual(propread_req.start_index.value, [0,0,0,0,0,0,0,0,0,0,0,1])
+        self.assertEqual(propread_req.number_of_elements_start_index.value, b'\xF0\x01')
+
 class Test06CEMIFrameCrafting(unittest.TestCase):
     """Test class for KNX messages involving a cEMI frame."""
     def test_01_knx_config_req(self):